@@ -3,11 +3,21 @@ Playwright browser on steroids with HTTP proxy support.
 """
 
 import asyncio
+import dataclasses
 import gc
+import hashlib
+import itertools
 import logging
+import os
+import shutil
+import signal
+import tempfile
+import weakref
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from typing import Optional, Dict, Any, List
 
+import httpx
 from playwright._impl._api_structures import ProxySettings
 from playwright.async_api import Browser as PlaywrightBrowser
 from playwright.async_api import (
@@ -20,6 +30,61 @@ from browser_use.utils import time_execution_async
 
 logger = logging.getLogger(__name__)
 
+_BASE_ARGS = (
+    '--no-sandbox',
+    '--disable-blink-features=AutomationControlled',
+    '--disable-infobars',
+    '--disable-background-timer-throttling',
+    '--disable-popup-blocking',
+    '--disable-backgrounding-occluded-windows',
+    '--disable-renderer-backgrounding',
+    '--disable-window-activation',
+    '--disable-focus-on-load',
+    '--no-first-run',
+    '--no-default-browser-check',
+    '--no-startup-window',
+    '--window-position=0,0',
+    # '--window-size=1280,1000',
+)
+
+_SECURITY_ARGS = (
+    '--disable-web-security',
+    '--disable-site-isolation-trials',
+    '--disable-features=IsolateOrigins,site-per-process',
+)
+
+
+def _cert_and_profile_args(config: 'BrowserConfig') -> tuple[str, ...]:
+    """HTTPS error handling, custom CA certificate and user data dir arguments"""
+    args = []
+    if config.ignore_https_errors:
+        args.append("--ignore-certificate-errors")
+    if config.proxy_ca_cert:
+        args.append(f"--ca-certificates-path={config.proxy_ca_cert}")
+    if config.user_data_dir:
+        args.append(f"--user-data-dir={config.user_data_dir}")
+    return tuple(args)
+
+
+def _proxy_cli_args(config: 'BrowserConfig') -> tuple[str, ...]:
+    """Proxy as Chrome command line flags, for browsers not launched through Playwright"""
+    args = []
+    if config.proxy_server:
+        args.append(f"--proxy-server={config.proxy_server}")
+    if config.proxy_bypass:
+        args.append(f"--proxy-bypass-list={config.proxy_bypass}")
+    return tuple(args)
+
+
+def _launch_args(config: 'BrowserConfig') -> list[str]:
+    """Chromium arguments for browsers we launch ourselves, built from the config as it is at launch time"""
+    return list(itertools.chain(
+        _BASE_ARGS,
+        _SECURITY_ARGS if config.disable_security else (),
+        _cert_and_profile_args(config),
+        config.extra_chromium_args,
+    ))
+
 
 @dataclass
 class BrowserConfig:
@@ -63,6 +128,10 @@ class BrowserConfig:
             
         proxy_ca_cert: None
             Path to custom CA certificate for proxy SSL inspection
+
+        share_browser: False
+            Launch one Chromium per config and connect every Browser with that config to it over CDP.
+            The proxy server is passed to Chromium, credentials are set on each context.
     """
 
     headless: bool = False
@@ -83,6 +152,7 @@ class BrowserConfig:
     new_context_config: BrowserContextConfig = field(default_factory=BrowserContextConfig)
     _force_keep_browser_alive: bool = False
     user_data_dir: str | None = None
+    share_browser: bool = False
 
     def __post_init__(self):
         # Set up proxy configuration if proxy server is provided
@@ -102,16 +172,192 @@ class BrowserConfig:
             self.proxy = ProxySettings(**proxy_settings)
 
 
-# @singleton: TODO - think about id singleton makes sense here
-# @dev By default this is a singleton, but you can create multiple instances if you need to.
+def _backoff(start: float = 0.05, cap: float = 1.0, attempts: int = 12):
+    """Exponentially growing delays for polling, capped at `cap` seconds"""
+    delay = start
+    for _ in range(attempts):
+        yield delay
+        delay = min(delay * 2, cap)
+
+
+def _config_key(config: BrowserConfig) -> str:
+    """Hash of all config fields, used to look up shared browser instances"""
+    return hashlib.blake2b(repr(dataclasses.asdict(config)).encode()).hexdigest()
+
+
+# asyncio locks are bound to the loop that first waits on them, so the caches below get one lock per event loop
+_loop_locks: dict[asyncio.AbstractEventLoop, dict[str, asyncio.Lock]] = {}
+
+
+def _loop_lock(name: str) -> asyncio.Lock:
+    """Lock `name` for the running event loop, forgetting locks of loops that have been closed"""
+    for loop in [loop for loop in _loop_locks if loop.is_closed()]:
+        del _loop_locks[loop]
+    locks = _loop_locks.setdefault(asyncio.get_running_loop(), {})
+    if name not in locks:
+        locks[name] = asyncio.Lock()
+    return locks[name]
+
+
+# Chromium processes launched for share_browser mode: (event loop, config key) -> launch task resolving to
+# (process, CDP url, temp user data dir). References are counted per launch, so holders of a Chromium that
+# died and was replaced still release the right one.
+_shared_chromium: dict[tuple, asyncio.Task] = {}
+_shared_chromium_refs: dict[asyncio.Task, int] = {}
+
+
+def _shared_chromium_usable(launch: asyncio.Task) -> bool:
+    """False once the launch failed or the launched process exited"""
+    if not launch.done():
+        return True
+    if launch.cancelled() or launch.exception() is not None:
+        return False
+    return launch.result()[0].returncode is None
+
+
+def _drop_closed_loop_chromium():
+    """Forget shared Chromiums launched on loops that have been closed, killing their processes"""
+    for key in [key for key in _shared_chromium if key[0].is_closed()]:
+        launch = _shared_chromium.pop(key)
+        _shared_chromium_refs.pop(launch, None)
+        if not launch.done() or not _shared_chromium_usable(launch):
+            continue
+        proc, _, temp_dir = launch.result()
+        # the process' transport belongs to the closed loop, so signal it directly
+        try:
+            os.kill(proc.pid, signal.SIGTERM)
+        except OSError:
+            pass
+        if temp_dir:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+async def _release_shared_chromium(key: tuple, launch: asyncio.Task):
+    """Drop one reference to a shared Chromium and terminate it when nobody uses it anymore"""
+    async with _loop_lock('shared_chromium'):
+        _shared_chromium_refs[launch] -= 1
+        if _shared_chromium_refs[launch] > 0:
+            return
+        del _shared_chromium_refs[launch]
+        if _shared_chromium.get(key) is launch:
+            del _shared_chromium[key]
+
+    try:
+        proc, cdp_url, temp_dir = await asyncio.shield(launch)
+    except Exception:
+        # the launch failed and cleaned up after itself
+        return
+
+    logger.debug(f'Stopping shared browser at {cdp_url}')
+    if proc.returncode is None:
+        proc.terminate()
+        try:
+            await asyncio.wait_for(proc.wait(), 5)
+        except asyncio.TimeoutError:
+            proc.kill()
+    if temp_dir:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+# Connections to remote browsers (cdp_url / wss_url): (event loop, kind, url, proxy) -> connect task resolving to
+# (playwright, browser). References are counted per connection, like the shared Chromium launches above.
+_CDP_CONN_CACHE: dict[tuple, asyncio.Task] = {}
+_CDP_CONN_REFS: dict[asyncio.Task, int] = {}
+
+
+def _remote_connection_usable(connect: asyncio.Task) -> bool:
+    """False once the connect failed or the browser disconnected"""
+    if not connect.done():
+        return True
+    if connect.cancelled() or connect.exception() is not None:
+        return False
+    return connect.result()[1].is_connected()
+
+
+def _evict_remote_connection(key: tuple, connect: asyncio.Task):
+    """Stop handing out a connection, browsers already using it keep their reference"""
+    if _CDP_CONN_CACHE.get(key) is connect:
+        del _CDP_CONN_CACHE[key]
+
+
+async def _release_remote_connection(
+    key: tuple, connect: asyncio.Task
+) -> tuple[Playwright, PlaywrightBrowser] | None:
+    """Drop one reference to a cached remote connection, returns it for closing once nobody uses it anymore"""
+    async with _loop_lock('remote'):
+        if connect not in _CDP_CONN_REFS:
+            return None
+        _CDP_CONN_REFS[connect] -= 1
+        if _CDP_CONN_REFS[connect] > 0:
+            return None
+        del _CDP_CONN_REFS[connect]
+        _evict_remote_connection(key, connect)
+
+    try:
+        return await asyncio.shield(connect)
+    except Exception:
+        # the connect failed and stopped its playwright
+        return None
+
+
+async def _close_browser_resources(
+    playwright: Playwright | None,
+    browser: PlaywrightBrowser | None,
+    remote_connection: tuple[tuple, asyncio.Task] | None,
+    shared_launch: tuple[tuple, asyncio.Task] | None,
+    chrome_proc: asyncio.subprocess.Process | None,
+):
+    """Close what a Browser holds, keeping connections and processes that other browsers still use"""
+    try:
+        if remote_connection is not None:
+            # a cached connection is closed by the last browser using it
+            playwright, browser = await _release_remote_connection(*remote_connection) or (None, None)
+        if browser:
+            await browser.close()
+        if playwright:
+            await playwright.stop()
+        if chrome_proc and chrome_proc.returncode is None:
+            chrome_proc.terminate()
+            try:
+                await asyncio.wait_for(chrome_proc.wait(), 5)
+            except asyncio.TimeoutError:
+                chrome_proc.kill()
+    finally:
+        if shared_launch:
+            await _release_shared_chromium(*shared_launch)
+
+
+# Keeps cleanup tasks scheduled by finalizers alive until they finish
+_finalizer_tasks: set[asyncio.Task] = set()
+
+
+def _schedule_close(loop: asyncio.AbstractEventLoop, *resources):
+    """weakref.finalize callback closing a Browser that was garbage collected without close()"""
+    if loop.is_closed() or not loop.is_running():
+        # Nothing can be awaited anymore (e.g. interpreter shutdown), the OS reaps the processes
+        return
+
+    def create_task():
+        task = loop.create_task(_close_browser_resources(*resources))
+        _finalizer_tasks.add(task)
+        task.add_done_callback(_finalizer_tasks.discard)
+
+    loop.call_soon_threadsafe(create_task)
+
+
+# @dev Use Browser.get_instance() to share one warm browser per config, or construct directly for a private instance.
 class Browser:
     """
     Playwright browser on steroids.
 
     This is persistant browser factory that can spawn multiple browser contexts.
     It is recommended to use only one instance of Browser per your application (RAM usage will grow otherwise).
+    Browser.get_instance() returns the same launched browser for every caller with an equal config.
     """
 
+    # (event loop, config key) -> Browser
+    _instances: dict[tuple, 'Browser'] = {}
+
     def __init__(
         self,
         config: BrowserConfig = BrowserConfig(),
@@ -121,13 +367,50 @@ class Browser:
         self.playwright: Playwright | None = None
         self.playwright_browser: PlaywrightBrowser | None = None
 
-        self.disable_security_args = []
-        if self.config.disable_security:
-            self.disable_security_args = [
-                '--disable-web-security',
-                '--disable-site-isolation-trials',
-                '--disable-features=IsolateOrigins,site-per-process',
-            ]
+        # Set when the instance is handed out by get_instance()
+        self._registry_key: tuple | None = None
+        self._refcount = 0
+        # Set when connected to a Chromium shared through share_browser
+        self._shared_launch: tuple[tuple, asyncio.Task] | None = None
+        # Set when using a cached cdp_url / wss_url connection
+        self._remote_connection: tuple[tuple, asyncio.Task] | None = None
+        # Chrome process started for chrome_instance_path, if we had to launch one
+        self._chrome_proc: asyncio.subprocess.Process | None = None
+        # Closes the resources on the creating loop if the Browser is garbage collected without close()
+        self._finalizer: weakref.finalize | None = None
+        # Serializes _init so concurrent callers don't launch two browsers
+        self._init_lock = asyncio.Lock()
+
+    @classmethod
+    async def get_instance(cls, config: BrowserConfig = BrowserConfig()) -> 'Browser':
+        """
+        Get the shared browser for this config, launching it on first use.
+
+        Every call must be balanced by a close(); the browser is only closed once the last holder closes it.
+        """
+        key = (asyncio.get_running_loop(), _config_key(config))
+        # browsers launched on a loop that has since closed can't be used anymore
+        for stale in [k for k in cls._instances if k[0].is_closed()]:
+            del cls._instances[stale]
+
+        instance = cls._instances.get(key)
+        if instance is None or (instance.playwright_browser is not None and not instance._is_connected()):
+            # Published before launching, so concurrent callers wait on this instance's _init_lock
+            # and callers with other configs don't wait at all
+            instance = cls(config)
+            instance._registry_key = key
+            cls._instances[key] = instance
+        instance._refcount += 1
+
+        try:
+            await instance.get_playwright_browser()
+        except BaseException:
+            await instance.close()
+            raise
+        return instance
+
+    def _is_connected(self) -> bool:
+        return self.playwright_browser is not None and self.playwright_browser.is_connected()
 
     async def new_context(self, config: BrowserContextConfig = BrowserContextConfig()) -> BrowserContext:
         """Create a browser context"""
@@ -135,22 +418,84 @@ class Browser:
 
     async def get_playwright_browser(self) -> PlaywrightBrowser:
         """Get a browser context"""
-        if self.playwright_browser is None:
-            return await self._init()
+        if self.playwright_browser is not None:
+            return self.playwright_browser
 
+        async with self._init_lock:
+            if self.playwright_browser is None:
+                await self._init()
         return self.playwright_browser
 
     @time_execution_async('--init (browser)')
     async def _init(self):
         """Initialize the browser session"""
-        playwright = await async_playwright().start()
-        browser = await self._setup_browser(playwright)
+        if self.config.cdp_url or self.config.wss_url:
+            playwright, browser = await self._connect_remote()
+        else:
+            playwright = await async_playwright().start()
+            browser = await self._setup_browser(playwright)
 
         self.playwright = playwright
         self.playwright_browser = browser
 
+        if not self.config._force_keep_browser_alive:
+            self._finalizer = weakref.finalize(
+                self,
+                _schedule_close,
+                asyncio.get_running_loop(),
+                playwright,
+                browser,
+                self._remote_connection,
+                self._shared_launch,
+                self._chrome_proc,
+            )
+
         return self.playwright_browser
 
+    async def _connect_remote(self) -> tuple[Playwright, PlaywrightBrowser]:
+        """Connects to cdp_url / wss_url, reusing a live connection to the same endpoint if one exists."""
+        loop = asyncio.get_running_loop()
+        if self.config.cdp_url:
+            key = (loop, 'cdp', self.config.cdp_url)
+        else:
+            key = (loop, 'wss', self.config.wss_url)
+        key += (tuple(sorted(self.config.proxy.items())) if self.config.proxy else None,)
+
+        async with _loop_lock('remote'):
+            # connections made on a loop that has since closed can't be used or closed anymore
+            for stale in [k for k in _CDP_CONN_CACHE if k[0].is_closed()]:
+                _CDP_CONN_REFS.pop(_CDP_CONN_CACHE.pop(stale), None)
+
+            connect = _CDP_CONN_CACHE.get(key)
+            if connect is not None and _remote_connection_usable(connect):
+                logger.debug(f'Reusing connection to remote browser {key[2]}')
+            else:
+                # connected outside the lock so closing browsers of other endpoints doesn't wait on it
+                connect = asyncio.ensure_future(self._open_remote_connection(key))
+                _CDP_CONN_CACHE[key] = connect
+            _CDP_CONN_REFS[connect] = _CDP_CONN_REFS.get(connect, 0) + 1
+
+        try:
+            # shielded so one cancelled caller doesn't abort the connect for the others waiting on it
+            playwright, browser = await asyncio.shield(connect)
+        except BaseException:
+            await _close_browser_resources(None, None, (key, connect), None, None)
+            raise
+        self._remote_connection = (key, connect)
+        return playwright, browser
+
+    async def _open_remote_connection(self, key: tuple) -> tuple[Playwright, PlaywrightBrowser]:
+        """Starts playwright and connects to the remote browser, run as the cached connect task for `key`."""
+        playwright = await async_playwright().start()
+        try:
+            browser = await self._setup_browser(playwright)
+        except BaseException:
+            await playwright.stop()
+            raise
+        connect = asyncio.current_task()
+        browser.on('disconnected', lambda _: _evict_remote_connection(key, connect))
+        return playwright, browser
+
     async def _setup_cdp(self, playwright: Playwright) -> PlaywrightBrowser:
         """Sets up and returns a Playwright Browser instance with anti-detection measures."""
         if not self.config.cdp_url:
@@ -192,64 +537,57 @@ class Browser:
         """Sets up and returns a Playwright Browser instance with anti-detection measures."""
         if not self.config.chrome_instance_path:
             raise ValueError('Chrome instance path is required')
-        import subprocess
-
-        import requests
 
         # Additional proxy arguments for Chrome instance
-        extra_args = []
-        if self.config.proxy_server:
-            extra_args.append(f"--proxy-server={self.config.proxy_server}")
-        if self.config.proxy_bypass:
-            extra_args.append(f"--proxy-bypass-list={self.config.proxy_bypass}")
-        if self.config.ignore_https_errors:
-            extra_args.append("--ignore-certificate-errors")
-        if self.config.proxy_ca_cert:
-            extra_args.append(f"--ca-certificates-path={self.config.proxy_ca_cert}")
-        if self.config.user_data_dir:
-            extra_args.append(f"--user-data-dir={self.config.user_data_dir}")
-
-        try:
-            logger.info(f"Initializing browser with extra args: {extra_args}")
-
-            # Check if browser is already running
-            response = requests.get('http://localhost:9222/json/version', timeout=2)
-            if response.status_code == 200:
-                logger.info('Reusing existing Chrome instance')
-                browser = await playwright.chromium.connect_over_cdp(
-                    endpoint_url='http://localhost:9222',
-                    timeout=20000,  # 20 second timeout for connection
-                )
-                return browser
-        except requests.ConnectionError:
-            logger.debug('No existing Chrome instance found, starting a new one')
-
-        # Start a new Chrome instance with proxy settings if available
-        cmd_args = [
-            self.config.chrome_instance_path,
-            '--remote-debugging-port=9222',
-        ]
-        cmd_args.extend(extra_args)
-        cmd_args.extend(self.config.extra_chromium_args)
-        
-        # Log the command for debugging
-        logger.debug(f"Starting Chrome with args: {cmd_args}")
-        
-        subprocess.Popen(
-            cmd_args,
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-        )
-
-        # Attempt to connect again after starting a new instance
-        for _ in range(10):
+        extra_args = [*_proxy_cli_args(self.config), *_cert_and_profile_args(self.config)]
+
+        # One client for every probe, so retries reuse the same connection
+        async with httpx.AsyncClient(
+            base_url='http://localhost:9222',
+            timeout=0.5,
+            limits=httpx.Limits(max_keepalive_connections=1),
+        ) as client:
             try:
-                response = requests.get('http://localhost:9222/json/version', timeout=2)
+                logger.info(f"Initializing browser with extra args: {extra_args}")
+
+                # Check if browser is already running
+                response = await client.get('/json/version', timeout=2)
                 if response.status_code == 200:
-                    break
-            except requests.ConnectionError:
-                pass
-            await asyncio.sleep(1)
+                    logger.info('Reusing existing Chrome instance')
+                    browser = await playwright.chromium.connect_over_cdp(
+                        endpoint_url='http://localhost:9222',
+                        timeout=20000,  # 20 second timeout for connection
+                    )
+                    return browser
+            except httpx.TransportError:
+                logger.debug('No existing Chrome instance found, starting a new one')
+
+            # Start a new Chrome instance with proxy settings if available
+            cmd_args = [
+                self.config.chrome_instance_path,
+                '--remote-debugging-port=9222',
+            ]
+            cmd_args.extend(extra_args)
+            cmd_args.extend(self.config.extra_chromium_args)
+            
+            # Log the command for debugging
+            logger.debug(f"Starting Chrome with args: {cmd_args}")
+            
+            self._chrome_proc = await asyncio.create_subprocess_exec(
+                *cmd_args,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+
+            # Wait for the debugging port, polling with exponential backoff
+            for delay in _backoff():
+                try:
+                    response = await client.get('/json/version')
+                    if response.status_code == 200:
+                        break
+                except httpx.TransportError:
+                    pass
+                await asyncio.sleep(delay)
 
         # Attempt to connect again after starting a new instance
         try:
@@ -273,42 +611,8 @@ class Browser:
 
     async def _setup_standard_browser(self, playwright: Playwright) -> PlaywrightBrowser:
         """Sets up and returns a Playwright Browser instance with anti-detection measures."""
-        # Base arguments
-        args = [
-            '--no-sandbox',
-            '--disable-blink-features=AutomationControlled',
-            '--disable-infobars',
-            '--disable-background-timer-throttling',
-            '--disable-popup-blocking',
-            '--disable-backgrounding-occluded-windows',
-            '--disable-renderer-backgrounding',
-            '--disable-window-activation',
-            '--disable-focus-on-load',
-            '--no-first-run',
-            '--no-default-browser-check',
-            '--no-startup-window',
-            '--window-position=0,0',
-            # '--window-size=1280,1000',
-        ]
-        
-        # Add security-related args
-        args.extend(self.disable_security_args)
-        
-        # Add HTTPS error handling if configured
-        if self.config.ignore_https_errors:
-            args.append("--ignore-certificate-errors")
-        
-        # Add custom CA certificate if provided
-        if self.config.proxy_ca_cert:
-            args.append(f"--ca-certificates-path={self.config.proxy_ca_cert}")
-
-        if self.config.user_data_dir:
-            args.append(f"--user-data-dir={self.config.user_data_dir}")
-
-        logger.info(f"Initializing browser with extra args: {args}")
-            
-        # Add user-specified args
-        args.extend(self.config.extra_chromium_args)
+        args = _launch_args(self.config)
+        logger.info(f"Initializing browser with args: {args}")
         
         # Prepare launch parameters
         launch_params = {
@@ -326,6 +630,76 @@ class Browser:
         
         return browser
 
+    async def _launch_shared_chromium(self, playwright: Playwright) -> tuple[asyncio.subprocess.Process, str, str | None]:
+        """Launches Chromium with a remote debugging port and returns the process, its CDP url and temp user data dir."""
+        temp_dir = None
+        user_data_dir = self.config.user_data_dir
+        if not user_data_dir:
+            temp_dir = user_data_dir = tempfile.mkdtemp(prefix='browser-use-')
+
+        # Chromium writes the port it picked for --remote-debugging-port=0 to this file
+        port_file = os.path.join(user_data_dir, 'DevToolsActivePort')
+        if os.path.exists(port_file):
+            os.remove(port_file)
+
+        # Without a Playwright pipe attached, a startup window is what keeps Chromium running
+        cmd_args = [
+            playwright.chromium.executable_path,
+            '--remote-debugging-port=0',
+            *(arg for arg in _launch_args(self.config) if arg != '--no-startup-window'),
+        ]
+        if not self.config.user_data_dir:
+            cmd_args.append(f"--user-data-dir={user_data_dir}")
+        if self.config.headless:
+            cmd_args.append('--headless=new')
+        cmd_args.extend(_proxy_cli_args(self.config))
+
+        logger.debug(f"Starting shared Chrome with args: {cmd_args}")
+        proc = await asyncio.create_subprocess_exec(
+            *cmd_args,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+
+        for _ in range(200):
+            if proc.returncode is not None:
+                break
+            try:
+                with open(port_file) as f:
+                    port, path = f.read().split()[:2]
+                return proc, f'ws://127.0.0.1:{port}{path}', temp_dir
+            except (FileNotFoundError, ValueError):
+                await asyncio.sleep(0.1)
+
+        if proc.returncode is None:
+            proc.kill()
+        if temp_dir:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+        raise RuntimeError('Shared Chrome instance did not expose a remote debugging port')
+
+    async def _setup_shared_browser(self, playwright: Playwright) -> PlaywrightBrowser:
+        """Connects to the Chromium shared by all browsers with this config, launching it on first use."""
+        key = (asyncio.get_running_loop(), _config_key(self.config))
+        async with _loop_lock('shared_chromium'):
+            _drop_closed_loop_chromium()
+            launch = _shared_chromium.get(key)
+            if launch is None or not _shared_chromium_usable(launch):
+                # launched outside the lock so browsers with other configs don't wait on this one
+                launch = asyncio.ensure_future(self._launch_shared_chromium(playwright))
+                _shared_chromium[key] = launch
+            _shared_chromium_refs[launch] = _shared_chromium_refs.get(launch, 0) + 1
+
+        try:
+            # shielded so one cancelled caller doesn't abort the launch for the others waiting on it
+            _, cdp_url, _ = await asyncio.shield(launch)
+            logger.info(f'Connecting to shared browser via CDP {cdp_url}')
+            browser = await playwright.chromium.connect_over_cdp(endpoint_url=cdp_url, timeout=20000)
+        except BaseException:
+            await _release_shared_chromium(key, launch)
+            raise
+        self._shared_launch = (key, launch)
+        return browser
+
     async def _setup_browser(self, playwright: Playwright) -> PlaywrightBrowser:
         """Sets up and returns a Playwright Browser instance with anti-detection measures."""
         try:
@@ -335,6 +709,8 @@ class Browser:
                 return await self._setup_wss(playwright)
             elif self.config.chrome_instance_path:
                 return await self._setup_browser_with_instance(playwright)
+            elif self.config.share_browser:
+                return await self._setup_shared_browser(playwright)
             else:
                 return await self._setup_standard_browser(playwright)
         except Exception as e:
@@ -343,31 +719,147 @@ class Browser:
 
     async def close(self):
         """Close the browser instance"""
+        if self._registry_key is not None:
+            self._refcount = max(self._refcount - 1, 0)
+            if self._refcount > 0 or self.config._force_keep_browser_alive:
+                return
+            if Browser._instances.get(self._registry_key) is self:
+                del Browser._instances[self._registry_key]
+            self._registry_key = None
+
         try:
             if not self.config._force_keep_browser_alive:
-                if self.playwright_browser:
-                    await self.playwright_browser.close()
-                    del self.playwright_browser
-                if self.playwright:
-                    await self.playwright.stop()
-                    del self.playwright
-
+                await _close_browser_resources(
+                    self.playwright, self.playwright_browser, self._remote_connection, self._shared_launch, self._chrome_proc
+                )
         except Exception as e:
             logger.debug(f'Failed to close browser properly: {e}')
         finally:
+            if self._finalizer:
+                self._finalizer.detach()
+                self._finalizer = None
+            self._shared_launch = None
+            self._remote_connection = None
+            self._chrome_proc = None
             self.playwright_browser = None
             self.playwright = None
 
             gc.collect()
 
-    def __del__(self):
-        """Async cleanup when object is destroyed"""
+
+class BrowserPool:
+    """
+    Bounded pool of warm browsers.
+
+    At most max_size browsers are checked out at once, further acquire() calls wait until one is released.
+    Released browsers go back to a FIFO queue and are reused, so each one is launched only once.
+
+    Usage:
+        pool = BrowserPool(BrowserConfig(headless=True), min_size=2, max_size=4)
+        async with pool.get() as browser:
+            agent = Agent(task=task, llm=llm, browser=browser)
+            await agent.run()
+        await pool.close()
+    """
+
+    def __init__(self, config: BrowserConfig = BrowserConfig(), min_size: int = 1, max_size: int = 4):
+        if not 0 <= min_size <= max_size or max_size < 1:
+            raise ValueError('BrowserPool requires 0 <= min_size <= max_size and max_size >= 1')
+        self.config = config
+        self.min_size = min_size
+        self.max_size = max_size
+
+        self._idle: asyncio.Queue[Browser] = asyncio.Queue()
+        self._checked_out: set[Browser] = set()
+        self._slots = asyncio.BoundedSemaphore(max_size)
+        self._warm_lock = asyncio.Lock()
+        self._warmed = False
+        self._closed = False
+
+    async def _launch(self) -> Browser:
+        browser = Browser(self.config)
+        await browser.get_playwright_browser()
+        return browser
+
+    async def acquire(self) -> Browser:
+        """Check out a browser, waiting while max_size browsers are in use"""
+        if self._closed:
+            raise RuntimeError('BrowserPool is closed')
+        await self._slots.acquire()
         try:
-            if self.playwright_browser or self.playwright:
-                loop = asyncio.get_running_loop()
-                if loop.is_running():
-                    loop.create_task(self.close())
-                else:
-                    asyncio.run(self.close())
-        except Exception as e:
-            logger.debug(f'Failed to cleanup browser in destructor: {e}')
\ No newline at end of file
+            if self._closed:
+                raise RuntimeError('BrowserPool is closed')
+
+            # Launch min_size browsers on first use
+            async with self._warm_lock:
+                if not self._warmed:
+                    launched = await asyncio.gather(
+                        *(self._launch() for _ in range(self.min_size)), return_exceptions=True
+                    )
+                    # Keep the browsers that did launch, then report the first failure
+                    self._warmed = True
+                    errors = [result for result in launched if isinstance(result, BaseException)]
+                    for browser in launched:
+                        if not isinstance(browser, BaseException):
+                            self._idle.put_nowait(browser)
+                    if self._closed:
+                        # close() ran during the warm-up, before these browsers were queued
+                        await self._close_idle()
+                    if errors:
+                        raise errors[0]
+            if self._closed:
+                raise RuntimeError('BrowserPool is closed')
+
+            browser = await self._take_idle()
+            if browser is None:
+                browser = await self._launch()
+                if self._closed:
+                    await browser.close()
+                    raise RuntimeError('BrowserPool is closed')
+            self._checked_out.add(browser)
+            return browser
+        except BaseException:
+            self._slots.release()
+            raise
+
+    async def _take_idle(self) -> Browser | None:
+        """Oldest idle browser that is still connected, closing the ones that crashed while idle"""
+        while not self._idle.empty():
+            browser = self._idle.get_nowait()
+            if browser._is_connected():
+                return browser
+            logger.debug('Discarding disconnected idle browser')
+            await browser.close()
+        return None
+
+    async def _close_idle(self):
+        while not self._idle.empty():
+            await self._idle.get_nowait().close()
+
+    async def release(self, browser: Browser):
+        """Return a browser to the pool, closing it instead if it is no longer connected"""
+        if browser not in self._checked_out:
+            raise ValueError('Browser is not checked out from this pool')
+        self._checked_out.remove(browser)
+        try:
+            if self._closed or not browser._is_connected():
+                logger.debug('Discarding browser released to the pool')
+                await browser.close()
+            else:
+                self._idle.put_nowait(browser)
+        finally:
+            self._slots.release()
+
+    @asynccontextmanager
+    async def get(self):
+        """Check out a browser for the duration of the `async with` block"""
+        browser = await self.acquire()
+        try:
+            yield browser
+        finally:
+            await self.release(browser)
+
+    async def close(self):
+        """Close idle browsers; browsers still checked out or still warming up are closed when they come back"""
+        self._closed = True
+        await self._close_idle()
@@ -340,6 +340,8 @@ class BrowserContext:
 				record_video_dir=self.config.save_recording_path,
 				record_video_size=self.config.browser_window_size,
 				locale=self.config.locale,
+				# share_browser connects over CDP, so proxy credentials can only be given per context
+				proxy=self.browser.config.proxy if self.browser.config.share_browser else None,
 			)
 		
 		await self._register_http_handlers(context)
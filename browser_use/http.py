@@ -1,17 +1,47 @@
 import base64
 import xml.etree.ElementTree as ET
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Any
 
 from playwright.sync_api import Request, Response
 
-DEFAULT_INCLUDE_MIME = ["html", "script", "xml", "flash", "other_text"]
-DEFAULT_INCLUDE_STATUS = ["2xx", "3xx", "4xx", "5xx"]
+DEFAULT_INCLUDE_MIME = frozenset(["html", "script", "xml", "flash", "other_text"])
+DEFAULT_INCLUDE_STATUS = frozenset(["2xx", "3xx", "4xx", "5xx"])
 MAX_PAYLOAD_SIZE = 4000
+# Besides text/*, +json and +xml, response bodies of these media types are serialized as utf-8 text
+TEXT_MEDIA_TYPES = frozenset([
+    "application/json",
+    "application/javascript",
+    "application/x-javascript",
+    "application/xml",
+])
+
+def _build_status_table(include_status: frozenset[str]) -> bytearray:
+    """Lookup table where table[status] is 1 for status codes matched by the "Nxx" prefixes"""
+    table = bytearray(600)
+    for prefix in include_status:
+        lo = int(prefix[0]) * 100
+        table[lo:lo + 100] = b"\x01" * 100
+    return table
+
+_STATUS_TABLE = _build_status_table(DEFAULT_INCLUDE_STATUS)
+
+def is_included_status(status: int) -> bool:
+    """Check a status code against DEFAULT_INCLUDE_STATUS"""
+    return 0 <= status < len(_STATUS_TABLE) and bool(_STATUS_TABLE[status])
+
+def is_text_media_type(content_type: str) -> bool:
+    """Check whether a Content-Type header value names a textual media type"""
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    return (
+        media_type.startswith("text/")
+        or media_type in TEXT_MEDIA_TYPES
+        or media_type.endswith(("+json", "+xml"))
+    )
 
-@dataclass
-class HTTPRequestData:
-    """Internal representation of HTTP request data"""
+@dataclass(slots=True)
+class HTTPRequest:
+    """HTTP request captured from the browser"""
     method: str
     url: str
     headers: Dict[str, str]
@@ -20,77 +50,48 @@ class HTTPRequestData:
     redirected_to_url: Optional[str] 
     is_iframe: bool
 
-class HTTPRequest:
-    """HTTP request class with unified implementation"""
-    def __init__(self, data: HTTPRequestData):
-        self._data = data
-
-    @property
-    def method(self) -> str:
-        return self._data.method
-
-    @property
-    def url(self) -> str:
-        return self._data.url
-
-    @property
-    def headers(self) -> Dict[str, str]:
-        return self._data.headers
-
-    @property
-    def post_data(self) -> Optional[str]:
-        return self._data.post_data
-
-    @property
     def redirected_from(self) -> Optional["HTTPRequest"]:
-        if self._data.redirected_from_url:
-            # Create minimal request object for redirect
-            data = HTTPRequestData(
+        """Minimal request object for the request this one was redirected from"""
+        if self.redirected_from_url:
+            return HTTPRequest(
                 method="",
-                url=self._data.redirected_from_url,
+                url=self.redirected_from_url,
                 headers={},
                 post_data=None,
                 redirected_from_url=None,
                 redirected_to_url=None,
                 is_iframe=False
             )
-            return HTTPRequest(data)
         return None
 
-    @property
     def redirected_to(self) -> Optional["HTTPRequest"]:
-        if self._data.redirected_to_url:
-            # Create minimal request object for redirect
-            data = HTTPRequestData(
+        """Minimal request object for the request this one redirects to"""
+        if self.redirected_to_url:
+            return HTTPRequest(
                 method="",
-                url=self._data.redirected_to_url,
+                url=self.redirected_to_url,
                 headers={},
                 post_data=None,
                 redirected_from_url=None,
                 redirected_to_url=None,
                 is_iframe=False
             )
-            return HTTPRequest(data)
         return None
 
-    @property
-    def is_iframe(self) -> bool:
-        return self._data.is_iframe
-
     def to_json(self) -> Dict[str, Any]:
         return {
             "method": self.method,
             "url": self.url,
             "headers": self.headers,
             "post_data": self.post_data,
-            "redirected_from": self._data.redirected_from_url,
-            "redirected_to": self._data.redirected_to_url,
+            "redirected_from": self.redirected_from_url,
+            "redirected_to": self.redirected_to_url,
             "is_iframe": self.is_iframe
         }
 
     @classmethod
     def from_json(cls, data: Dict[str, Any]) -> "HTTPRequest":
-        request_data = HTTPRequestData(
+        return cls(
             method=data["method"],
             url=data["url"],
             headers=data["headers"],
@@ -99,80 +100,69 @@ class HTTPRequest:
             redirected_to_url=data["redirected_to"],
             is_iframe=data["is_iframe"]
         )
-        return cls(request_data)
 
     @classmethod
     def from_pw(cls, request: Request) -> "HTTPRequest":
-        request_data = HTTPRequestData(
+        # Each property access goes through Playwright's impl-to-api mapping, so only read them once
+        redirected_from = request.redirected_from
+        redirected_to = request.redirected_to
+        # Playwright builds a fresh dict on every access, so it can be kept without copying
+        headers = request.headers
+        if not isinstance(headers, dict):
+            headers = dict(headers)
+        return cls(
             method=request.method,
             url=request.url,
-            headers=dict(request.headers),
+            headers=headers,
             post_data=request.post_data,
-            redirected_from_url=request.redirected_from.url if request.redirected_from else None,
-            redirected_to_url=request.redirected_to.url if request.redirected_to else None,
+            redirected_from_url=redirected_from.url if redirected_from else None,
+            redirected_to_url=redirected_to.url if redirected_to else None,
             is_iframe=bool(request.frame.parent_frame)
         )
-        return cls(request_data)
 
     def to_str(self) -> str:
         """String representation of HTTP request"""
-        req_str = "[Request]: " + str(self.method) + " " + str(self.url) + "\n"
+        parts = ["[Request]: ", str(self.method), " ", str(self.url), "\n"]
         
-        if self.redirected_from:
-            req_str += "Redirected from: " + str(self.redirected_from.url) + "\n"
-        if self.redirected_to:
-            req_str += "Redirecting to: " + str(self.redirected_to.url) + "\n"
+        if self.redirected_from_url:
+            parts += ("Redirected from: ", self.redirected_from_url, "\n")
+        if self.redirected_to_url:
+            parts += ("Redirecting to: ", self.redirected_to_url, "\n")
         if self.is_iframe:
-            req_str += "From iframe\n"
+            parts.append("From iframe\n")
 
-        req_str += str(self.headers) + "\n"
-        req_str += str(self.post_data)
-        return req_str
+        parts += (str(self.headers), "\n", str(self.post_data))
+        return "".join(parts)
 
-@dataclass
-class HTTPResponseData:
-    """Internal representation of HTTP response data"""
+@dataclass(slots=True)
+class HTTPResponse:
+    """HTTP response captured from the browser"""
     url: str
     status: int
     headers: Dict[str, str]
     is_iframe: bool
     body: Optional[bytes] = None
     body_error: Optional[str] = None
+    # Derived from headers at construction
+    content_type: str = field(init=False)
+    content_length: int = field(init=False)
 
-class HTTPResponse:
-    """HTTP response class with unified implementation"""
-    def __init__(self, data: HTTPResponseData):
-        self._data = data
-
-    @property
-    def url(self) -> str:
-        return self._data.url
-
-    @property
-    def status(self) -> int:
-        return self._data.status
-
-    @property
-    def headers(self) -> Dict[str, str]:
-        return self._data.headers
-
-    @property
-    def is_iframe(self) -> bool:
-        return self._data.is_iframe
+    def __post_init__(self):
+        headers = self.headers or {}
+        self.content_type = headers.get("content-type", "").lower()
+        content_length = headers.get("content-length")
+        self.content_length = int(content_length) if content_length and content_length.isdigit() else 0
 
     async def get_body(self) -> bytes:
-        if self._data.body_error:
-            raise Exception(self._data.body_error)
-        if self._data.body is None:
+        if self.body_error:
+            raise Exception(self.body_error)
+        if self.body is None:
             raise Exception("Response body not available")
-        return self._data.body
+        return self.body
 
     def get_content_type(self) -> str:
         """Get content type from response headers"""
-        if not self.headers:
-            return ""
-        content_type = self.headers.get("content-type", "")
-        return content_type.lower()
+        return self.content_type
     
     def get_status_code(self) -> int:
         """Get HTTP status code"""
@@ -182,74 +172,86 @@ class HTTPResponse:
     
     def get_response_size(self) -> int:
         """Get response payload size in bytes"""
-        if not self.headers:
-            return 0
-        content_length = self.headers.get("content-length")
-        if content_length and content_length.isdigit():
-            return int(content_length)
-        return 0
+        return self.content_length
 
-    async def to_json(self) -> Dict[str, Any]:
+    def to_json(self) -> Dict[str, Any]:
         json_data = {
             "url": self.url,
             "status": self.status,
             "headers": self.headers,
-            "content_type": self.get_content_type(),
-            "content_length": self.get_response_size(),
+            "content_type": self.content_type,
+            "content_length": self.content_length,
             "is_iframe": self.is_iframe
         }
 
         if not (300 <= self.status < 400):
-            if self._data.body_error:
-                json_data["body_error"] = self._data.body_error
-            elif self._data.body:
-                json_data["body"] = str(self._data.body)
+            if self.body_error:
+                json_data["body_error"] = self.body_error
+            elif self.body:
+                body_text = None
+                if is_text_media_type(self.content_type):
+                    try:
+                        body_text = self.body.decode("utf-8")
+                    except UnicodeDecodeError:
+                        # e.g. a text/html body in another charset, keep the exact bytes
+                        pass
+                if body_text is not None:
+                    json_data["body"] = body_text
+                    json_data["body_encoding"] = "utf-8"
+                else:
+                    json_data["body"] = base64.b64encode(self.body).decode("ascii")
+                    json_data["body_encoding"] = "base64"
 
         return json_data
 
     @classmethod
     def from_json(cls, data: Dict[str, Any]) -> "HTTPResponse":
-        response_data = HTTPResponseData(
+        body = None
+        if "body" in data:
+            if data.get("body_encoding") == "base64":
+                body = base64.b64decode(data["body"])
+            else:
+                body = data["body"].encode()
+        return cls(
             url=data["url"],
             status=data["status"],
             headers=data["headers"],
             is_iframe=data["is_iframe"],
-            body=data.get("body", "").encode() if "body" in data else None,
+            body=body,
             body_error=data.get("body_error")
         )
-        return cls(response_data)
 
     @classmethod
     def from_pw(cls, response: Response) -> "HTTPResponse":
-        response_data = HTTPResponseData(
+        return cls(
             url=response.url,
             status=response.status,
-            headers=dict(response.headers),
+            # Playwright returns a fresh dict with lowercased keys, so it needs neither a copy nor normalizing
+            headers=response.headers,
             is_iframe=bool(response.frame.parent_frame)
         )
-        return cls(response_data)
 
     async def to_str(self) -> str:
         """String representation of HTTP response"""
-        resp_str = "[Response]: " + str(self.url) + " " + str(self.status) + "\n"
+        parts = ["[Response]: ", str(self.url), " ", str(self.status), "\n"]
         
         if self.is_iframe:
-            resp_str += "From iframe\n"
-        resp_str += str(self.headers) + "\n"
+            parts.append("From iframe\n")
+        parts += (str(self.headers), "\n")
         
         if 300 <= self.status < 400:
-            resp_str += "[Redirect response - no body]"
-            return resp_str
+            parts.append("[Redirect response - no body]")
+            return "".join(parts)
             
         try:
             resp_bytes = await self.get_body()
-            resp_str += str(resp_bytes)
+            parts.append(str(resp_bytes))
         except Exception as e:
-            resp_str += f"[Error getting response body: {str(e)}]"
+            parts.append(f"[Error getting response body: {str(e)}]")
             
-        return resp_str
+        return "".join(parts)
 
-@dataclass
+@dataclass(slots=True)
 class HTTPMessage:
     """Encapsulates a request/response pair"""
     request: HTTPRequest 
@@ -272,16 +274,16 @@ class HTTPMessage:
         return f"{self.method} {self.url}\n{self.body}"
     
     async def to_str(self) -> str:
-        req_str = str(self.request)
+        req_str = self.request.to_str()
         resp_str = await self.response.to_str() if self.response else ""
         return f"{req_str}\n{resp_str}"
 
-    async def to_json(self) -> Dict[str, Any]:
+    def to_json(self) -> Dict[str, Any]:
         json_data = {
-            "request": await self.request.to_json()
+            "request": self.request.to_json()
         }
         if self.response:
-            json_data["response"] = await self.response.to_json()
+            json_data["response"] = self.response.to_json()
         return json_data
 
     @classmethod
@@ -330,8 +332,7 @@ def parse_burp_request(request_text: str, is_base64: bool, url: str, method: str
                 post_data[k] = v       
             
     headers = parse_burp_headers(headers_text)
-    # Create request data
-    request_data = HTTPRequestData(
+    return HTTPRequest(
         method=method,
         url=url,
         headers=headers,
@@ -340,8 +341,6 @@ def parse_burp_request(request_text: str, is_base64: bool, url: str, method: str
         redirected_to_url=None,    # No redirect info in Burp export
         is_iframe=False            # No iframe info in Burp export
     )
-    
-    return HTTPRequest(request_data)
 
 def parse_burp_response(response_text: str, is_base64: bool, url: str, status: int) -> HTTPResponse:
     """Parse raw HTTP response data into a HTTPResponse object"""
@@ -368,8 +367,7 @@ def parse_burp_response(response_text: str, is_base64: bool, url: str, status: i
     
     headers = parse_burp_headers(headers_text)
     
-    # Create response data
-    response_data = HTTPResponseData(
+    return HTTPResponse(
         url=url,
         status=status,
         headers=headers,
@@ -377,8 +375,6 @@ def parse_burp_response(response_text: str, is_base64: bool, url: str, status: i
         body=body,
         body_error=body_error
     )
-    
-    return HTTPResponse(response_data)
 
 def parse_burp_xml(filepath: str) -> List[HTTPMessage]:
     """Parse a Burp Suite XML export file into an HTTPMessageList"""
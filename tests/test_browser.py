@@ -1,7 +1,6 @@
 import asyncio
+import httpx
 import pytest
-import requests
-import subprocess
 from browser_use.browser.browser import Browser, BrowserConfig
 from browser_use.browser.context import BrowserContext, BrowserContextConfig
 from playwright._impl._api_structures import ProxySettings
@@ -39,7 +38,10 @@ async def test_cdp_browser_launch(monkeypatch):
     and returns the expected DummyBrowser.
     """
     class DummyBrowser:
-        pass
+        def on(self, event, handler):
+            pass
+        def is_connected(self):
+            return True
     class DummyChromium:
         async def connect_over_cdp(self, endpoint_url, timeout=20000):
             assert endpoint_url == "ws://dummy-cdp-url", "The endpoint URL should match the configuration."
@@ -65,10 +67,13 @@ async def test_wss_browser_launch(monkeypatch):
     the Browser uses _setup_wss and returns the expected DummyBrowser.
     """
     class DummyBrowser:
-        pass
+        def on(self, event, handler):
+            pass
+        def is_connected(self):
+            return True
     class DummyChromium:
-        async def connect(self, wss_url):
-            assert wss_url == "ws://dummy-wss-url", "WSS URL should match the configuration."
+        async def connect(self, ws_endpoint):
+            assert ws_endpoint == "ws://dummy-wss-url", "WSS URL should match the configuration."
             return DummyBrowser()
     class DummyPlaywright:
         def __init__(self):
@@ -91,14 +96,14 @@ async def test_chrome_instance_browser_launch(monkeypatch):
     _setup_browser_with_instance branch and returns the expected DummyBrowser object
     by reusing an existing Chrome instance.
     """
-    # Dummy response for requests.get when checking chrome debugging endpoint.
+    # Dummy response for httpx.AsyncClient.get when checking chrome debugging endpoint.
     class DummyResponse:
         status_code = 200
-    def dummy_get(url, timeout):
-        if url == "http://localhost:9222/json/version":
+    async def dummy_get(self, url, **kwargs):
+        if url == "/json/version":
             return DummyResponse()
-        raise requests.ConnectionError("Connection failed")
-    monkeypatch.setattr(requests, "get", dummy_get)
+        raise httpx.ConnectError("Connection failed")
+    monkeypatch.setattr(httpx.AsyncClient, "get", dummy_get)
     class DummyBrowser:
         pass
     class DummyChromium:
@@ -194,15 +199,23 @@ async def test_chrome_instance_browser_launch_failure(monkeypatch):
     Test that when a Chrome instance cannot be started or connected to,
     the Browser._setup_browser_with_instance branch eventually raises a RuntimeError.
     We simulate failure by:
-      - Forcing requests.get to always raise a ConnectionError (so no existing instance is found).
-      - Monkeypatching subprocess.Popen to do nothing.
+      - Forcing httpx.AsyncClient.get to always raise a ConnectError (so no existing instance is found).
+      - Monkeypatching asyncio.create_subprocess_exec to return a dummy process.
       - Replacing asyncio.sleep to avoid delays.
       - Having the dummy playwright's connect_over_cdp method always raise an Exception.
     """
-    def dummy_get(url, timeout):
-        raise requests.ConnectionError("Simulated connection failure")
-    monkeypatch.setattr(requests, "get", dummy_get)
-    monkeypatch.setattr(subprocess, "Popen", lambda args, stdout, stderr: None)
+    async def dummy_get(self, url, **kwargs):
+        raise httpx.ConnectError("Simulated connection failure")
+    monkeypatch.setattr(httpx.AsyncClient, "get", dummy_get)
+    class DummyProcess:
+        returncode = None
+        def terminate(self):
+            self.returncode = 0
+        async def wait(self):
+            return self.returncode
+    async def dummy_create_subprocess_exec(*args, stdout, stderr):
+        return DummyProcess()
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", dummy_create_subprocess_exec)
     async def fake_sleep(seconds):
         return
     monkeypatch.setattr(asyncio, "sleep", fake_sleep)
@@ -303,4 +316,600 @@ async def test_standard_browser_launch_with_proxy(monkeypatch):
     # Call get_playwright_browser and verify that the returned browser is as expected.
     result_browser = await browser_obj.get_playwright_browser()
     assert isinstance(result_browser, DummyBrowser), "Expected DummyBrowser from _setup_standard_browser with proxy provided"
-    await browser_obj.close()
\ No newline at end of file
+    await browser_obj.close()
+@pytest.mark.asyncio
+async def test_get_instance_reuses_browser(monkeypatch):
+    """
+    Test that Browser.get_instance returns the same launched browser for equal configs,
+    and that the underlying browser is only closed once every holder has closed it.
+    """
+    launches = []
+    class DummyBrowser:
+        def __init__(self):
+            self.closed = False
+        def is_connected(self):
+            return not self.closed
+        async def close(self):
+            self.closed = True
+    class DummyChromium:
+        async def launch(self, headless, args, proxy=None):
+            browser = DummyBrowser()
+            launches.append(browser)
+            return browser
+    class DummyPlaywright:
+        def __init__(self):
+            self.chromium = DummyChromium()
+        async def stop(self):
+            pass
+    class DummyAsyncPlaywrightContext:
+        async def start(self):
+            return DummyPlaywright()
+    monkeypatch.setattr("browser_use.browser.browser.async_playwright", lambda: DummyAsyncPlaywrightContext())
+    monkeypatch.setattr(Browser, "_instances", {})
+    first = await Browser.get_instance(BrowserConfig(headless=True, extra_chromium_args=["--test"]))
+    second = await Browser.get_instance(BrowserConfig(headless=True, extra_chromium_args=["--test"]))
+    assert first is second, "Expected equal configs to share one Browser instance"
+    assert len(launches) == 1, "Expected the browser to be launched only once"
+    await first.close()
+    assert not launches[0].closed, "Expected the browser to stay open while another holder remains"
+    await second.close()
+    assert launches[0].closed, "Expected the browser to close once the last holder closes it"
+    third = await Browser.get_instance(BrowserConfig(headless=True, extra_chromium_args=["--test"]))
+    assert third is not first, "Expected a fresh Browser after the shared one was closed"
+    await third.close()
+@pytest.mark.asyncio
+async def test_get_instance_launches_configs_concurrently(monkeypatch):
+    """
+    Test that get_instance() for one config doesn't wait behind a slow launch for another,
+    while concurrent callers with the same config still share a single launch.
+    """
+    slow_launch_allowed = asyncio.Event()
+    launches = []
+    class DummyBrowser:
+        def is_connected(self):
+            return True
+        async def close(self):
+            pass
+    class DummyChromium:
+        async def launch(self, headless, args, proxy=None):
+            launches.append(headless)
+            if headless:
+                await slow_launch_allowed.wait()
+            return DummyBrowser()
+    class DummyPlaywright:
+        def __init__(self):
+            self.chromium = DummyChromium()
+        async def stop(self):
+            pass
+    class DummyAsyncPlaywrightContext:
+        async def start(self):
+            return DummyPlaywright()
+    monkeypatch.setattr("browser_use.browser.browser.async_playwright", lambda: DummyAsyncPlaywrightContext())
+    monkeypatch.setattr(Browser, "_instances", {})
+    slow_callers = asyncio.gather(*(Browser.get_instance(BrowserConfig(headless=True)) for _ in range(2)))
+    await asyncio.sleep(0)
+    fast = await asyncio.wait_for(Browser.get_instance(BrowserConfig(headless=False)), 1)
+    slow_launch_allowed.set()
+    first, second = await slow_callers
+    assert first is second, "Expected concurrent callers with one config to share the Browser"
+    assert launches.count(True) == 1, "Expected a single launch for the shared config"
+    for browser_obj in (first, second, fast):
+        await browser_obj.close()
+    assert Browser._instances == {}, "Expected closed browsers to leave the registry"
+def test_get_instance_not_reused_across_event_loops(monkeypatch):
+    """
+    Test that get_instance() does not hand out a Browser launched on an event loop that has since closed.
+    """
+    class DummyBrowser:
+        def is_connected(self):
+            return True
+        async def close(self):
+            pass
+    class DummyChromium:
+        async def launch(self, headless, args, proxy=None):
+            return DummyBrowser()
+    class DummyPlaywright:
+        def __init__(self):
+            self.chromium = DummyChromium()
+        async def stop(self):
+            pass
+    class DummyAsyncPlaywrightContext:
+        async def start(self):
+            return DummyPlaywright()
+    monkeypatch.setattr("browser_use.browser.browser.async_playwright", lambda: DummyAsyncPlaywrightContext())
+    monkeypatch.setattr(Browser, "_instances", {})
+    config = BrowserConfig(headless=True, _force_keep_browser_alive=True)
+    first = asyncio.run(Browser.get_instance(config))
+    second = asyncio.run(Browser.get_instance(config))
+    assert first is not second, "Expected a new Browser for the second event loop"
+    assert list(Browser._instances.values()) == [second], "Expected the closed loop's Browser to be dropped"
+@pytest.mark.asyncio
+async def test_share_browser_launches_chromium_once(monkeypatch):
+    """
+    Test that browsers configured with share_browser connect over CDP to a single Chromium process,
+    which is only terminated once the last of them is closed.
+    """
+    class DummyProcess:
+        returncode = None
+        def terminate(self):
+            self.returncode = 0
+        async def wait(self):
+            return self.returncode
+    processes = []
+    async def dummy_launch(self, playwright):
+        proc = DummyProcess()
+        processes.append(proc)
+        return proc, "ws://127.0.0.1:1234/devtools/browser/dummy", None
+    monkeypatch.setattr(Browser, "_launch_shared_chromium", dummy_launch)
+    class DummyBrowser:
+        async def close(self):
+            pass
+    class DummyChromium:
+        async def connect_over_cdp(self, endpoint_url, timeout=20000):
+            assert endpoint_url == "ws://127.0.0.1:1234/devtools/browser/dummy", "Expected the shared CDP url"
+            return DummyBrowser()
+    class DummyPlaywright:
+        def __init__(self):
+            self.chromium = DummyChromium()
+        async def stop(self):
+            pass
+    class DummyAsyncPlaywrightContext:
+        async def start(self):
+            return DummyPlaywright()
+    monkeypatch.setattr("browser_use.browser.browser.async_playwright", lambda: DummyAsyncPlaywrightContext())
+    first = Browser(config=BrowserConfig(headless=True, share_browser=True))
+    second = Browser(config=BrowserConfig(headless=True, share_browser=True))
+    assert isinstance(await first.get_playwright_browser(), DummyBrowser)
+    assert isinstance(await second.get_playwright_browser(), DummyBrowser)
+    assert len(processes) == 1, "Expected a single Chromium process for both browsers"
+    await first.close()
+    assert processes[0].returncode is None, "Expected Chromium to keep running while still in use"
+    await second.close()
+    assert processes[0].returncode == 0, "Expected Chromium to be terminated after the last browser closed"
+@pytest.mark.asyncio
+async def test_share_browser_relaunches_exited_chromium(monkeypatch):
+    """
+    Test that a shared Chromium whose process exited is launched again for the next browser,
+    and that the browser still holding the dead one releases it without touching the new one.
+    """
+    class DummyProcess:
+        returncode = None
+        def terminate(self):
+            self.returncode = 0
+        async def wait(self):
+            return self.returncode
+    processes = []
+    async def dummy_launch(self, playwright):
+        proc = DummyProcess()
+        processes.append(proc)
+        return proc, "ws://127.0.0.1:1234/devtools/browser/dummy", None
+    monkeypatch.setattr(Browser, "_launch_shared_chromium", dummy_launch)
+    class DummyBrowser:
+        async def close(self):
+            pass
+    class DummyChromium:
+        async def connect_over_cdp(self, endpoint_url, timeout=20000):
+            return DummyBrowser()
+    class DummyPlaywright:
+        def __init__(self):
+            self.chromium = DummyChromium()
+        async def stop(self):
+            pass
+    class DummyAsyncPlaywrightContext:
+        async def start(self):
+            return DummyPlaywright()
+    monkeypatch.setattr("browser_use.browser.browser.async_playwright", lambda: DummyAsyncPlaywrightContext())
+    first = Browser(config=BrowserConfig(headless=True, share_browser=True))
+    await first.get_playwright_browser()
+    processes[0].returncode = 1  # Chromium crashed
+    second = Browser(config=BrowserConfig(headless=True, share_browser=True))
+    await second.get_playwright_browser()
+    assert len(processes) == 2, "Expected Chromium to be launched again after it exited"
+    await first.close()
+    assert processes[1].returncode is None, "Expected the new Chromium to keep running while still in use"
+    await second.close()
+    assert processes[1].returncode == 0, "Expected the new Chromium to be terminated after its last browser closed"
+@pytest.mark.asyncio
+async def test_cdp_connection_reused(monkeypatch):
+    """
+    Test that browsers pointing at the same CDP url share one connection,
+    which is only closed once the last of them is closed.
+    """
+    connections = []
+    class DummyBrowser:
+        def __init__(self):
+            self.closed = False
+        def on(self, event, handler):
+            pass
+        def is_connected(self):
+            return not self.closed
+        async def close(self):
+            self.closed = True
+    class DummyChromium:
+        async def connect_over_cdp(self, endpoint_url, timeout=20000):
+            browser = DummyBrowser()
+            connections.append(browser)
+            return browser
+    class DummyPlaywright:
+        def __init__(self):
+            self.chromium = DummyChromium()
+        async def stop(self):
+            pass
+    class DummyAsyncPlaywrightContext:
+        async def start(self):
+            return DummyPlaywright()
+    monkeypatch.setattr("browser_use.browser.browser.async_playwright", lambda: DummyAsyncPlaywrightContext())
+    first = Browser(config=BrowserConfig(cdp_url="ws://dummy-shared-cdp-url"))
+    second = Browser(config=BrowserConfig(cdp_url="ws://dummy-shared-cdp-url"))
+    assert await first.get_playwright_browser() is await second.get_playwright_browser()
+    assert len(connections) == 1, "Expected a single CDP connection for both browsers"
+    await first.close()
+    assert not connections[0].closed, "Expected the connection to stay open while still in use"
+    await second.close()
+    assert connections[0].closed, "Expected the connection to be closed after the last browser closed"
+@pytest.mark.asyncio
+async def test_slow_cdp_connect_does_not_block_other_endpoints(monkeypatch):
+    """
+    Test that while one CDP endpoint is still connecting, browsers for other endpoints
+    can connect and close without waiting for it.
+    """
+    slow_connected = asyncio.Event()
+    class DummyBrowser:
+        closed = False
+        def on(self, event, handler):
+            pass
+        def is_connected(self):
+            return not self.closed
+        async def close(self):
+            self.closed = True
+    class DummyChromium:
+        async def connect_over_cdp(self, endpoint_url, timeout=20000):
+            if endpoint_url == "ws://slow":
+                await slow_connected.wait()
+            return DummyBrowser()
+    class DummyPlaywright:
+        def __init__(self):
+            self.chromium = DummyChromium()
+        async def stop(self):
+            pass
+    class DummyAsyncPlaywrightContext:
+        async def start(self):
+            return DummyPlaywright()
+    monkeypatch.setattr("browser_use.browser.browser.async_playwright", lambda: DummyAsyncPlaywrightContext())
+    slow = Browser(config=BrowserConfig(cdp_url="ws://slow"))
+    slow_task = asyncio.create_task(slow.get_playwright_browser())
+    await asyncio.sleep(0)
+    fast = Browser(config=BrowserConfig(cdp_url="ws://fast"))
+    fast_browser = await asyncio.wait_for(fast.get_playwright_browser(), 1)
+    await asyncio.wait_for(fast.close(), 1)
+    assert fast_browser.closed, "Expected the fast endpoint to close while the slow one was connecting"
+    slow_connected.set()
+    await slow_task
+    await slow.close()
+@pytest.mark.asyncio
+async def test_failed_cdp_connect_stops_playwright(monkeypatch):
+    """
+    Test that the Playwright driver started for a remote connection is stopped when connecting fails.
+    """
+    class DummyChromium:
+        async def connect_over_cdp(self, endpoint_url, timeout=20000):
+            raise RuntimeError("connect failed")
+    class DummyPlaywright:
+        stopped = False
+        def __init__(self):
+            self.chromium = DummyChromium()
+        async def stop(self):
+            self.stopped = True
+    playwrights = []
+    class DummyAsyncPlaywrightContext:
+        async def start(self):
+            playwrights.append(DummyPlaywright())
+            return playwrights[-1]
+    monkeypatch.setattr("browser_use.browser.browser.async_playwright", lambda: DummyAsyncPlaywrightContext())
+    browser_obj = Browser(config=BrowserConfig(cdp_url="ws://dummy-failing-cdp-url"))
+    with pytest.raises(RuntimeError, match="connect failed"):
+        await browser_obj.get_playwright_browser()
+    assert playwrights[0].stopped, "Expected playwright to be stopped after the failed connect"
+def test_cdp_connection_not_reused_across_event_loops(monkeypatch):
+    """
+    Test that a CDP connection cached while one event loop ran is not handed
+    to a browser running on a later event loop.
+    """
+    connections = []
+    class DummyBrowser:
+        def on(self, event, handler):
+            pass
+        def is_connected(self):
+            return True
+        async def close(self):
+            pass
+    class DummyChromium:
+        async def connect_over_cdp(self, endpoint_url, timeout=20000):
+            browser = DummyBrowser()
+            connections.append(browser)
+            return browser
+    class DummyPlaywright:
+        def __init__(self):
+            self.chromium = DummyChromium()
+        async def stop(self):
+            pass
+    class DummyAsyncPlaywrightContext:
+        async def start(self):
+            return DummyPlaywright()
+    monkeypatch.setattr("browser_use.browser.browser.async_playwright", lambda: DummyAsyncPlaywrightContext())
+    async def connect():
+        # left open on purpose, so the connection stays cached after the loop closes
+        browser_obj = Browser(config=BrowserConfig(cdp_url="ws://dummy-loop-cdp-url", _force_keep_browser_alive=True))
+        return await browser_obj.get_playwright_browser()
+    first = asyncio.run(connect())
+    second = asyncio.run(connect())
+    assert first is not second, "Expected a new CDP connection for the second event loop"
+    assert len(connections) == 2
+@pytest.mark.asyncio
+async def test_unreferenced_browser_is_closed(monkeypatch):
+    """
+    Test that a Browser garbage collected without close() still gets its playwright browser
+    closed and playwright stopped on the event loop that created them.
+    """
+    import gc
+    class DummyBrowser:
+        closed = False
+        async def close(self):
+            self.closed = True
+    class DummyChromium:
+        async def launch(self, headless, args, proxy=None):
+            return DummyBrowser()
+    class DummyPlaywright:
+        stopped = False
+        def __init__(self):
+            self.chromium = DummyChromium()
+        async def stop(self):
+            self.stopped = True
+    class DummyAsyncPlaywrightContext:
+        async def start(self):
+            return DummyPlaywright()
+    monkeypatch.setattr("browser_use.browser.browser.async_playwright", lambda: DummyAsyncPlaywrightContext())
+    browser_obj = Browser(config=BrowserConfig(headless=True))
+    playwright_browser = await browser_obj.get_playwright_browser()
+    playwright = browser_obj.playwright
+    del browser_obj
+    gc.collect()
+    for _ in range(3):
+        await asyncio.sleep(0)
+    assert playwright_browser.closed, "Expected the playwright browser to be closed by the finalizer"
+    assert playwright.stopped, "Expected playwright to be stopped by the finalizer"
+@pytest.mark.asyncio
+async def test_concurrent_get_playwright_browser_launches_once(monkeypatch):
+    """
+    Test that concurrent get_playwright_browser calls on the same Browser only launch one browser.
+    """
+    launches = []
+    class DummyBrowser:
+        async def close(self):
+            pass
+    class DummyChromium:
+        async def launch(self, headless, args, proxy=None):
+            await asyncio.sleep(0)
+            browser = DummyBrowser()
+            launches.append(browser)
+            return browser
+    class DummyPlaywright:
+        def __init__(self):
+            self.chromium = DummyChromium()
+        async def stop(self):
+            pass
+    class DummyAsyncPlaywrightContext:
+        async def start(self):
+            return DummyPlaywright()
+    monkeypatch.setattr("browser_use.browser.browser.async_playwright", lambda: DummyAsyncPlaywrightContext())
+    browser_obj = Browser(config=BrowserConfig(headless=True))
+    first, second = await asyncio.gather(browser_obj.get_playwright_browser(), browser_obj.get_playwright_browser())
+    assert first is second, "Expected both callers to receive the same browser"
+    assert len(launches) == 1, "Expected the browser to be launched only once"
+    await browser_obj.close()
+@pytest.mark.asyncio
+async def test_browser_pool_reuses_and_bounds_browsers(monkeypatch):
+    """
+    Test that BrowserPool warms min_size browsers, never hands out more than max_size at once,
+    reuses released browsers in FIFO order and discards released browsers that are disconnected.
+    """
+    from browser_use.browser.browser import BrowserPool
+    launches = []
+    class DummyBrowser:
+        def __init__(self):
+            self.closed = False
+        def is_connected(self):
+            return not self.closed
+        async def close(self):
+            self.closed = True
+    class DummyChromium:
+        async def launch(self, headless, args, proxy=None):
+            browser = DummyBrowser()
+            launches.append(browser)
+            return browser
+    class DummyPlaywright:
+        def __init__(self):
+            self.chromium = DummyChromium()
+        async def stop(self):
+            pass
+    class DummyAsyncPlaywrightContext:
+        async def start(self):
+            return DummyPlaywright()
+    monkeypatch.setattr("browser_use.browser.browser.async_playwright", lambda: DummyAsyncPlaywrightContext())
+    pool = BrowserPool(BrowserConfig(headless=True), min_size=2, max_size=2)
+    first = await pool.acquire()
+    assert len(launches) == 2, "Expected min_size browsers to be launched on first acquire"
+    second = await pool.acquire()
+    assert len(launches) == 2, "Expected the second acquire to use the warm browser"
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(pool.acquire(), 0.05)
+    await pool.release(first)
+    async with pool.get() as third:
+        assert third is first, "Expected the released browser to be reused"
+    second.playwright_browser.closed = True
+    await pool.release(second)
+    async with pool.get() as fourth:
+        assert fourth is first, "Expected the disconnected browser to be discarded"
+    await pool.close()
+    assert launches[0].closed, "Expected idle browsers to be closed with the pool"
+@pytest.mark.asyncio
+async def test_browser_pool_close_covers_warm_up_and_waiters(monkeypatch):
+    """
+    Test that closing a BrowserPool closes browsers from a warm-up still in progress,
+    and that acquire() calls waiting for a slot fail instead of launching browsers.
+    """
+    launch_allowed = asyncio.Event()
+    from browser_use.browser.browser import BrowserPool
+    launches = []
+    class DummyBrowser:
+        def __init__(self):
+            self.closed = False
+        def is_connected(self):
+            return not self.closed
+        async def close(self):
+            self.closed = True
+    class DummyChromium:
+        async def launch(self, headless, args, proxy=None):
+            await launch_allowed.wait()
+            browser = DummyBrowser()
+            launches.append(browser)
+            return browser
+    class DummyPlaywright:
+        def __init__(self):
+            self.chromium = DummyChromium()
+        async def stop(self):
+            pass
+    class DummyAsyncPlaywrightContext:
+        async def start(self):
+            return DummyPlaywright()
+    monkeypatch.setattr("browser_use.browser.browser.async_playwright", lambda: DummyAsyncPlaywrightContext())
+    pool = BrowserPool(BrowserConfig(headless=True), min_size=2, max_size=2)
+    warming = asyncio.create_task(pool.acquire())
+    await asyncio.sleep(0)
+    await pool.close()
+    launch_allowed.set()
+    with pytest.raises(RuntimeError, match="closed"):
+        await warming
+    assert len(launches) == 2 and all(browser.closed for browser in launches), "Expected warmed browsers to be closed"
+    pool = BrowserPool(BrowserConfig(headless=True), min_size=0, max_size=1)
+    browser = await pool.acquire()
+    waiting = asyncio.create_task(pool.acquire())
+    await asyncio.sleep(0)
+    await pool.close()
+    await pool.release(browser)
+    with pytest.raises(RuntimeError, match="closed"):
+        await waiting
+    assert len(launches) == 3, "Expected no launch for an acquire() made before close() returned"
+@pytest.mark.asyncio
+async def test_browser_pool_rejects_bad_releases_and_dead_idle_browsers(monkeypatch):
+    """
+    Test that releasing a browser twice or one the pool never handed out raises,
+    and that idle browsers which disconnected are not checked out.
+    """
+    from browser_use.browser.browser import BrowserPool
+    launches = []
+    class DummyBrowser:
+        def __init__(self):
+            self.closed = False
+        def is_connected(self):
+            return not self.closed
+        async def close(self):
+            self.closed = True
+    class DummyChromium:
+        async def launch(self, headless, args, proxy=None):
+            browser = DummyBrowser()
+            launches.append(browser)
+            return browser
+    class DummyPlaywright:
+        def __init__(self):
+            self.chromium = DummyChromium()
+        async def stop(self):
+            pass
+    class DummyAsyncPlaywrightContext:
+        async def start(self):
+            return DummyPlaywright()
+    monkeypatch.setattr("browser_use.browser.browser.async_playwright", lambda: DummyAsyncPlaywrightContext())
+    pool = BrowserPool(BrowserConfig(headless=True), min_size=1, max_size=1)
+    browser = await pool.acquire()
+    await pool.release(browser)
+    with pytest.raises(ValueError):
+        await pool.release(browser)
+    with pytest.raises(ValueError):
+        await pool.release(Browser(BrowserConfig(headless=True)))
+    browser.playwright_browser.closed = True  # crashed while idle
+    replacement = await pool.acquire()
+    assert replacement is not browser, "Expected the disconnected idle browser to be discarded"
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(pool.acquire(), 0.05)
+    await pool.release(replacement)
+    await pool.close()
+@pytest.mark.asyncio
+async def test_browser_pool_keeps_browsers_launched_before_warm_up_failure(monkeypatch):
+    """
+    Test that when one of the warm-up launches fails, acquire() raises but the
+    browsers that did launch stay in the pool instead of leaking.
+    """
+    from browser_use.browser.browser import BrowserPool
+    launches = []
+    class DummyBrowser:
+        closed = False
+        def is_connected(self):
+            return not self.closed
+        async def close(self):
+            self.closed = True
+    class DummyChromium:
+        async def launch(self, headless, args, proxy=None):
+            if len(launches) == 1:
+                launches.append(None)
+                raise RuntimeError("launch failed")
+            browser = DummyBrowser()
+            launches.append(browser)
+            return browser
+    class DummyPlaywright:
+        def __init__(self):
+            self.chromium = DummyChromium()
+        async def stop(self):
+            pass
+    class DummyAsyncPlaywrightContext:
+        async def start(self):
+            return DummyPlaywright()
+    monkeypatch.setattr("browser_use.browser.browser.async_playwright", lambda: DummyAsyncPlaywrightContext())
+    pool = BrowserPool(BrowserConfig(headless=True), min_size=2, max_size=2)
+    with pytest.raises(RuntimeError, match="launch failed"):
+        await pool.acquire()
+    browser = await pool.acquire()
+    assert browser.playwright_browser is launches[0], "Expected the browser that launched to be kept in the pool"
+    assert len(launches) == 2, "Expected no second warm-up after the failed one"
+    await pool.release(browser)
+    await pool.close()
+    assert launches[0].closed, "Expected the kept browser to be closed with the pool"
+@pytest.mark.asyncio
+async def test_standard_browser_uses_config_changes_after_construction(monkeypatch):
+    """
+    Test that launch arguments reflect changes made to the BrowserConfig after it was constructed.
+    """
+    class DummyBrowser:
+        async def close(self):
+            pass
+    class DummyChromium:
+        async def launch(self, headless, args, proxy=None):
+            assert "--late-arg" in args, "Expected args appended after construction to be used"
+            assert "--user-data-dir=/tmp/late-profile" in args, "Expected user_data_dir set after construction to be used"
+            assert "--disable-web-security" not in args, "Expected disable_security changed after construction to be used"
+            return DummyBrowser()
+    class DummyPlaywright:
+        def __init__(self):
+            self.chromium = DummyChromium()
+        async def stop(self):
+            pass
+    class DummyAsyncPlaywrightContext:
+        async def start(self):
+            return DummyPlaywright()
+    monkeypatch.setattr("browser_use.browser.browser.async_playwright", lambda: DummyAsyncPlaywrightContext())
+    config = BrowserConfig(headless=True)
+    config.extra_chromium_args.append("--late-arg")
+    config.user_data_dir = "/tmp/late-profile"
+    config.disable_security = False
+    browser_obj = Browser(config=config)
+    assert isinstance(await browser_obj.get_playwright_browser(), DummyBrowser)
+    await browser_obj.close()
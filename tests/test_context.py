@@ -41,6 +41,24 @@ def test_is_url_allowed():
     # Scenario 3: Malformed URL or empty domain
     # urlparse will return an empty netloc for some malformed URLs.
     assert context2._is_url_allowed("notaurl") is False
+@pytest.mark.asyncio
+async def test_shared_browser_context_gets_proxy_credentials():
+    """
+    Test that contexts of a share_browser Browser are created with the configured proxy,
+    since the shared Chromium only receives the proxy server on its command line.
+    """
+    from unittest.mock import AsyncMock
+    from browser_use.browser.browser import BrowserConfig
+    dummy_browser = Mock()
+    dummy_browser.config = BrowserConfig(
+        share_browser=True, proxy_server="http://proxy:3128", proxy_username="user", proxy_password="pass"
+    )
+    playwright_browser = Mock()
+    playwright_browser.new_context = AsyncMock(return_value=AsyncMock())
+    context = BrowserContext(browser=dummy_browser, config=BrowserContextConfig())
+    await context._create_context(playwright_browser)
+    proxy = playwright_browser.new_context.call_args.kwargs["proxy"]
+    assert proxy == {"server": "http://proxy:3128", "username": "user", "password": "pass"}
 def test_convert_simple_xpath_to_css_selector():
     """
     Test the _convert_simple_xpath_to_css_selector method of BrowserContext.
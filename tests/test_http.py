@@ -0,0 +1,130 @@
+import json
+
+import pytest
+
+from browser_use.http import HTTPMessage, HTTPRequest, HTTPResponse, is_included_status
+
+
+def make_response(content_type, body):
+    return HTTPResponse(url="http://example.com/", status=200, headers={"content-type": content_type}, is_iframe=False, body=body)
+
+
+def roundtrip(response):
+    return HTTPResponse.from_json(json.loads(json.dumps(response.to_json())))
+
+
+@pytest.mark.parametrize("content_type, body, encoding", [
+    ("text/html; charset=utf-8", "héllo <b>world</b>".encode(), "utf-8"),
+    ("application/json", b'{"a": 1}', "utf-8"),
+    ("application/ld+json", b'{"@id": "x"}', "utf-8"),
+    ("image/svg+xml", b"<svg/>", "utf-8"),
+    ("application/x-javascript", b"var a = 1;", "utf-8"),
+    ("application/octet-stream", bytes(range(256)), "base64"),
+    ("application/vnd.openxmlformats-officedocument.wordprocessingml.document", bytes(range(256)), "base64"),
+    ("text/html; charset=iso-8859-1", bytes(range(256)), "base64"),
+])
+def test_response_body_roundtrip(content_type, body, encoding):
+    """
+    Test that response bodies survive to_json/from_json unchanged, using utf-8 only for
+    textual media types whose body is valid utf-8 and base64 for everything else.
+    """
+    response = make_response(content_type, body)
+    assert response.to_json()["body_encoding"] == encoding
+    assert roundtrip(response).body == body
+
+
+def test_request_json_roundtrip():
+    """
+    Test that HTTPRequest is a plain slotted dataclass that survives to_json/from_json.
+    """
+    request = HTTPRequest(
+        method="POST",
+        url="http://example.com/",
+        headers={"accept": "*/*"},
+        post_data="a=1",
+        redirected_from_url=None,
+        redirected_to_url="http://example.com/next",
+        is_iframe=False,
+    )
+    assert HTTPRequest.from_json(request.to_json()) == request
+    assert not hasattr(request, "__dict__")
+
+
+def test_request_to_str():
+    """
+    Test the request string representation, including redirect and iframe lines.
+    """
+    request = HTTPRequest(
+        method="GET",
+        url="http://example.com/b",
+        headers={"accept": "*/*"},
+        post_data=None,
+        redirected_from_url="http://example.com/a",
+        redirected_to_url=None,
+        is_iframe=True,
+    )
+    assert request.to_str() == (
+        "[Request]: GET http://example.com/b\n"
+        "Redirected from: http://example.com/a\n"
+        "From iframe\n"
+        "{'accept': '*/*'}\n"
+        "None"
+    )
+
+
+@pytest.mark.asyncio
+async def test_message_to_str():
+    """
+    Test that HTTPMessage formats its request and response.
+    """
+    request = HTTPRequest("GET", "http://example.com/", {}, None, None, None, False)
+    response = HTTPResponse("http://example.com/", 302, {}, False)
+    message = HTTPMessage(request=request, response=response)
+    assert await message.to_str() == (
+        "[Request]: GET http://example.com/\n{}\nNone\n"
+        "[Response]: http://example.com/ 302\n{}\n[Redirect response - no body]"
+    )
+
+
+def test_request_redirect_links():
+    """
+    Test that redirected_from()/redirected_to() build requests only for the URLs that are set.
+    """
+    request = HTTPRequest("GET", "http://example.com/b", {}, None, "http://example.com/a", None, False)
+    assert request.redirected_from().url == "http://example.com/a"
+    assert request.redirected_to() is None
+
+
+@pytest.mark.parametrize("status, included", [
+    (-1, False), (0, False), (199, False), (200, True), (302, True), (404, True), (599, True), (600, False),
+])
+def test_is_included_status(status, included):
+    """
+    Test the status lookup table built from DEFAULT_INCLUDE_STATUS.
+    """
+    assert is_included_status(status) is included
+
+
+def test_response_derived_fields():
+    """
+    Test that content type and length are derived from the headers at construction.
+    """
+    response = HTTPResponse(
+        url="http://example.com/",
+        status=200,
+        headers={"content-type": "Text/HTML", "content-length": "12"},
+        is_iframe=False,
+    )
+    assert response.get_content_type() == "text/html"
+    assert response.get_response_size() == 12
+    assert HTTPResponse(url="u", status=200, headers={}, is_iframe=False).get_response_size() == 0
+
+
+def test_message_json_roundtrip():
+    """
+    Test that HTTPMessage.to_json is synchronous and round trips through from_json.
+    """
+    request = HTTPRequest("GET", "http://example.com/", {}, None, None, None, False)
+    response = HTTPResponse("http://example.com/", 200, {"content-type": "text/plain"}, False, body=b"ok")
+    message = HTTPMessage(request=request, response=response)
+    assert HTTPMessage.from_json(json.loads(json.dumps(message.to_json()))) == message